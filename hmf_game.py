@@ -5,14 +5,177 @@ Find instances of "FUCK" hidden in a grid of F, U, C, K letters.
 """
 
 import random
-import argparse
 import sys
-from datetime import datetime
-from typing import List, Tuple, Dict, Optional, Union
-import hashlib
+import time
+from datetime import date
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional, Sequence, Union, TYPE_CHECKING
+import zlib
+
+if TYPE_CHECKING:
+    import argparse
 
 # === ENGINE MODULE ===
 
+def _normalize_match(cells: List[Tuple[int, int]]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Normalize match cells for duplicate detection.
+    
+    A match is a straight run of cells, so its two end cells identify it
+    whichever way it reads; ordering them makes the key direction-free.
+    """
+    first, last = cells[0], cells[-1]
+    return (first, last) if first <= last else (last, first)
+
+
+@lru_cache(maxsize=4)
+def _allowed_directions(mode: str) -> Tuple[Tuple[str, int, int], ...]:
+    """Get allowed directions as (name, dr, dc) based on mode."""
+    if mode == 'horizontal':
+        names = ('E', 'W')
+    elif mode == 'horiz_vert':
+        names = ('N', 'S', 'E', 'W')
+    else:  # 'all'
+        names = tuple(GameEngine.DIRECTIONS)
+    return tuple((name, dr, dc) for name, (dr, dc) in GameEngine.DIRECTIONS.items()
+                 if name in names)
+
+
+@lru_cache(maxsize=4)
+def _scan_axes(mode: str) -> Tuple[Tuple[Tuple[int, int], Tuple[Tuple[str, int, bool], ...]], ...]:
+    """
+    Fold the allowed directions onto forward axes for the scanner.
+    
+    The opposite of a forward direction is the same line read backwards, so
+    each axis lists (name, rank, reverse) for the directions it covers, where
+    rank is the direction's position in GameEngine.DIRECTIONS.
+    """
+    rank = GameEngine._DIRECTION_RANK
+    axes = {}
+    for name, dr, dc in _allowed_directions(mode):
+        if dr > 0 or (dr == 0 and dc > 0):
+            axes.setdefault((dr, dc), []).append((name, rank[name], False))
+        else:
+            axes.setdefault((-dr, -dc), []).append((name, rank[name], True))
+    return tuple((axis, tuple(searches)) for axis, searches in axes.items())
+
+
+def _start_ranges(size: int, dr: int, dc: int, length: int) -> Tuple[range, range]:
+    """Start rows and columns from which a word of length fits along (dr, dc)."""
+    span = length - 1
+    return (range(max(0, -dr * span), size - max(0, dr * span)),
+            range(max(0, -dc * span), size - max(0, dc * span)))
+
+
+@lru_cache(maxsize=16)
+def _placement_candidates(size: int, length: int, mode: str) -> Tuple[Tuple, ...]:
+    """
+    List every in-bounds word placement for a grid size and direction mode.
+    
+    Each entry is (row, col, dir_name, cells, cell_slice), with the word's
+    cells resolved up front and a strided slice selecting them in the flat
+    grid. Start rows and columns are clamped per direction, so no
+    out-of-bounds placement is ever produced.
+    """
+    span = length - 1
+    candidates = []
+    for dir_name, dr, dc in _allowed_directions(mode):
+        rows, cols = _start_ranges(size, dr, dc, length)
+        for row in rows:
+            for col in cols:
+                cells = tuple((row + dr * i, col + dc * i) for i in range(length))
+                start = row * size + col
+                step = dr * size + dc
+                stop = start + step * span + (1 if step > 0 else -1)
+                cell_slice = slice(start, stop if stop >= 0 else None, step)
+                candidates.append((row, col, dir_name, cells, cell_slice))
+    return tuple(candidates)
+
+
+@lru_cache(maxsize=16)
+def _scan_plan(size: int, length: int, mode: str) -> Tuple[Tuple, ...]:
+    """
+    Precompute the scanner's work for one grid size and direction mode.
+    
+    Returns (axis, searches, step, valid) per forward axis from _scan_axes,
+    where step is the axis' stride in the flat grid and valid the _start_mask
+    of cells where the word fits along it.
+    """
+    return tuple(
+        ((dr, dc), searches, dr * size + dc, _start_mask(size, dr, dc, length))
+        for (dr, dc), searches in _scan_axes(mode)
+    )
+
+
+def _letter_bits(word: bytes) -> bytes:
+    """
+    bytes.translate table encoding letters as byte lanes for the SWAR scanner.
+    
+    The k-th letter of word gets bit k (its position reading forwards) and
+    bit 4 + length-1-k (its position reading backwards), so one pass over
+    the lanes tracks the word and its reverse together, like a combined
+    forward/reverse automaton. Words of up to 4 letters fit in a byte. Any
+    other byte maps to 0, so it can never take part in a match.
+    """
+    table = bytearray(256)
+    for k, letter in enumerate(word):
+        table[letter] = (1 << k) | (1 << (4 + len(word) - 1 - k))
+    return bytes(table)
+
+
+def _letter_chars(word: bytes) -> bytes:
+    """bytes.translate table undoing _letter_bits; unknown codes become '?'."""
+    table = bytearray(b'?' * 256)
+    for letter, code in enumerate(_letter_bits(word)):
+        if code:
+            table[code] = letter
+    return bytes(table)
+
+
+# Lane bits 0 and 4, which report a forward and a reverse match
+_BOTH_WAYS = 0x11
+
+# bytes.translate table turning every non-empty cell into a full 0xFF lane
+_OCCUPIED_LANES = bytes([0] + [0xFF] * 255)
+
+
+@lru_cache(maxsize=64)
+def _start_mask(size: int, dr: int, dc: int, length: int) -> int:
+    """Byte-lane mask with 1 in every cell where a word fits along (dr, dc)."""
+    rows, cols = _start_ranges(size, dr, dc, length)
+    lanes = bytearray(size * size)
+    for row in rows:
+        for col in cols:
+            lanes[row * size + col] = 1
+    return int.from_bytes(lanes, 'little')
+
+
+def _swar_hits(codes: int, step: int, length: int, valid: int) -> int:
+    """
+    Test every start cell for the word and its reverse at once, SWAR style.
+    
+    codes holds one byte lane per cell in the _letter_bits encoding. The
+    lane k steps along must carry bit k for the word and bit 4 + k for the
+    reverse; shifting it down by k more bits and ANDing all shifts leaves
+    bit 0 set where the word starts and bit 4 where its reverse starts.
+    Stops early once no candidate lane survives.
+    """
+    hits = valid * _BOTH_WAYS
+    for k in range(length):
+        if not hits:
+            break
+        hits &= codes >> (8 * step * k + k)
+    return hits
+
+
+def _find_all(haystack: bytes, needle: bytes):
+    """Yield every (possibly overlapping) index of needle in haystack."""
+    pos = haystack.find(needle)
+    while pos != -1:
+        yield pos
+        pos = haystack.find(needle, pos + 1)
+
+
 class GameEngine:
     """Core game logic for grid generation and word scanning."""
     
@@ -21,19 +184,30 @@ class GameEngine:
         'S': (1, 0), 'SW': (1, -1), 'W': (0, -1), 'NW': (-1, -1)
     }
     
+    # Order of each direction in DIRECTIONS; the scanner and placement
+    # matches both sort by it, so they report matches in the same order
+    _DIRECTION_RANK = {name: rank for rank, name in enumerate(DIRECTIONS)}
+    
     TARGET_WORD = "FUCK"
     LETTERS = ['F', 'U', 'C', 'K']
     
+    # Letter <-> lane code translate tables for the flat grid, built once at import
+    _LETTER_CODES = _letter_bits(TARGET_WORD.encode('ascii'))
+    _CODE_LETTERS = _letter_chars(TARGET_WORD.encode('ascii'))
+    
     def __init__(self, seed: Optional[Union[str, int]] = None):
         """Initialize the game engine with optional seed for determinism."""
         if seed is not None:
             if isinstance(seed, str):
                 # Convert string seed to integer hash
-                seed = int(hashlib.md5(seed.encode()).hexdigest()[:8], 16)
-            random.seed(seed)
+                seed = zlib.crc32(seed.encode())
             self.seed = seed
         else:
             self.seed = None
+        
+        # Private generator seeded once: placement and filling both draw from
+        # it, and the global random module is left untouched
+        self._rng = random.Random(self.seed)
     
     def generate_grid(self, size: int, requested_count: Union[int, Tuple[int, int]], 
                      distribution_mode: str = 'even', allow_overlap: bool = True,
@@ -54,225 +228,314 @@ class GameEngine:
         # Determine target count
         if isinstance(requested_count, tuple):
             min_count, max_count = requested_count
-            target_count = random.randint(min_count, max_count)
+            target_count = self._rng.randrange(min_count, max_count + 1)
         else:
             target_count = requested_count
         
-        # Get allowed directions
-        allowed_dirs = self._get_allowed_directions(directions_mode)
+        # Copy the shared placement table; _place_word reorders it in place
+        candidates = list(_placement_candidates(size, len(self.TARGET_WORD), directions_mode))
+        
+        # Reject counts no grid can hold before spending retries on them:
+        # every word needs its own line of cells, and without overlap its own
+        # cells. Each mode lists directions in opposite pairs, and a line
+        # cannot spell the word both ways, so there are half as many lines
+        # as candidates.
+        capacity = len(candidates) // 2
+        if allow_overlap:
+            hint = "Try a larger grid or reduce count."
+        else:
+            capacity = min(capacity, (size * size) // len(self.TARGET_WORD))
+            hint = "Try a larger grid, allow overlap, or reduce count."
+        if target_count > capacity:
+            raise RuntimeError(f"Cannot fit {target_count} words in a {size}x{size} grid "
+                              f"(at most {capacity} with these settings). {hint}")
         
         max_retries = 25
         for attempt in range(max_retries):
-            try:
-                grid = self._create_empty_grid(size)
-                matches = []
-                
-                # Place target words
-                for _ in range(target_count):
-                    if not self._place_word(grid, size, allowed_dirs, allow_overlap, matches):
-                        raise ValueError("Failed to place word")
-                
-                # Fill remaining cells
-                self._fill_grid(grid, size, distribution_mode)
-                
-                # Validate with scanner
-                scan_result = self.scan_grid(grid, directions_mode)
-                if scan_result['count'] == target_count:
-                    return {
-                        'grid': grid,
-                        'true_count': target_count,
-                        'matches': scan_result['matches'],
-                        'metadata': {
-                            'size': size,
-                            'distribution_mode': distribution_mode,
-                            'allow_overlap': allow_overlap,
-                            'directions_mode': directions_mode,
-                            'seed': self.seed
-                        }
+            result = self._generate_attempt(size, target_count, candidates, distribution_mode,
+                                            allow_overlap, directions_mode)
+            if result is not None:
+                grid, matches = result
+                return {
+                    'grid': self._grid_rows(grid, size),
+                    'true_count': target_count,
+                    'matches': matches,
+                    'metadata': {
+                        'size': size,
+                        'distribution_mode': distribution_mode,
+                        'allow_overlap': allow_overlap,
+                        'directions_mode': directions_mode,
+                        'seed': self.seed
                     }
-                    
-            except ValueError:
-                continue
+                }
         
         raise RuntimeError(f"Failed to generate valid grid after {max_retries} attempts. "
                           f"Try smaller grid, allow overlap, reduce count, or use even distribution.")
     
-    def scan_grid(self, grid: List[List[str]], directions_mode: str = 'all') -> Dict:
+    def _generate_attempt(self, size: int, target_count: int, candidates: List[Tuple],
+                          distribution_mode: str, allow_overlap: bool,
+                          directions_mode: str) -> Optional[Tuple[bytearray, List[Dict]]]:
+        """Build one candidate grid; return it with its matches, or None if it is unusable."""
+        grid = self._create_empty_grid(size)
+        placed = []
+        
+        # Place target words
+        for _ in range(target_count):
+            placement = self._place_word(grid, candidates, allow_overlap)
+            if placement is None:
+                return None
+            placed.append(placement)
+        
+        # Fill remaining cells
+        self._fill_grid(grid, size, distribution_mode)
+        
+        # Validate with a count-only scan: filler letters can spell extra words.
+        # Placements are distinct and never overwritten, so when the count is
+        # right they are exactly the grid's matches.
+        if self._count_flat(grid, size, directions_mode) != target_count:
+            return None
+        return grid, self._placement_matches(placed)
+    
+    def _placement_matches(self, placed: List[Tuple]) -> List[Dict]:
+        """Build match dicts for placed words, in the order scan_grid reports them."""
+        rank = self._DIRECTION_RANK
+        placed = sorted(placed, key=lambda entry: (entry[0], entry[1], rank[entry[2]]))
+        return [{'start': (row, col), 'direction': dir_name, 'cells': list(cells)}
+                for row, col, dir_name, cells, _ in placed]
+    
+    def scan_grid(self, grid: Sequence[Union[Sequence[str], str, bytes]],
+                  directions_mode: str = 'all') -> Dict:
         """
         Scan grid for all instances of the target word.
         
+        Rows may be lists of letters, strings, or bytes; bytes rows skip the
+        text round-trip and are translated to lane codes directly.
+        
         Returns:
             Dict with count and list of matches (each match has start, direction, cells)
         """
+        if grid and isinstance(grid[0], (bytes, bytearray)):
+            flat = b"".join(grid).translate(self._LETTER_CODES)
+        else:
+            flat = self._encode("".join("".join(row) for row in grid))
+        return self._scan_flat(flat, len(grid), directions_mode)
+    
+    def _encode(self, text: str) -> bytes:
+        """Encode letters to the internal lane codes with a single bytes.translate."""
+        return text.encode('ascii', 'replace').translate(self._LETTER_CODES)
+    
+    def _match_starts(self, flat: bytes, size: int, directions_mode: str):
+        """
+        Run the SWAR kernel over a flat grid of encoded letters.
+        
+        Yields (axis, search, starts) for each allowed direction with at least
+        one match, where starts has bit 0 set in every lane a match begins.
+        """
+        length = len(self.TARGET_WORD)
+        
+        # One byte lane per cell, as encoded by _letter_bits
+        codes = int.from_bytes(flat, 'little')
+        
+        for axis, searches, step, valid in _scan_plan(size, length, directions_mode):
+            # Every start cell along this axis is tested, both ways, in one SWAR pass
+            lanes = _swar_hits(codes, step, length, valid)
+            if not lanes:
+                continue
+            for search in searches:
+                starts = ((lanes >> 4) if search[2] else lanes) & valid
+                if starts:
+                    yield axis, search, starts
+    
+    def _count_flat(self, flat: bytes, size: int, directions_mode: str) -> int:
+        """Count target words in a flat encoded grid without building match dicts."""
+        return sum(bin(starts).count('1') for _, _, starts in
+                   self._match_starts(flat, size, directions_mode))
+    
+    def _scan_flat(self, flat: bytes, size: int, directions_mode: str) -> Dict:
+        """Scan a flat row-major grid of encoded letters for all instances of the target word."""
+        length = len(self.TARGET_WORD)
+        
+        found = []
+        for (dr, dc), (dir_name, rank, reverse), starts in self._match_starts(flat, size, directions_mode):
+            for pos in _find_all(starts.to_bytes(size * size, 'little'), b'\x01'):
+                row, col = divmod(pos, size)
+                cells = [(row + k * dr, col + k * dc) for k in range(length)]
+                if reverse:
+                    cells.reverse()
+                found.append((cells[0], rank, dir_name, cells))
+        
+        # Report in the same row/col/direction order as a cell-by-cell scan
+        found.sort(key=lambda item: (item[0], item[1]))
+        
         matches = []
-        size = len(grid)
-        allowed_dirs = self._get_allowed_directions(directions_mode)
-        
-        for row in range(size):
-            for col in range(size):
-                for dir_name, (dr, dc) in allowed_dirs.items():
-                    match = self._check_word_at_position(grid, row, col, dr, dc, size)
-                    if match:
-                        # Normalize match to avoid duplicates
-                        normalized = self._normalize_match(match)
-                        if not self._is_duplicate_match(normalized, matches):
-                            matches.append({
-                                'start': (row, col),
-                                'direction': dir_name,
-                                'cells': match
-                            })
+        seen = set()
+        for start, _, dir_name, cells in found:
+            # Normalize match to avoid duplicates
+            normalized = _normalize_match(cells)
+            if normalized in seen:
+                continue
+            seen.add(normalized)
+            matches.append({
+                'start': start,
+                'direction': dir_name,
+                'cells': cells
+            })
         
         return {'count': len(matches), 'matches': matches}
     
-    def _get_allowed_directions(self, mode: str) -> Dict[str, Tuple[int, int]]:
-        """Get allowed directions based on mode."""
-        if mode == 'horizontal':
-            return {'E': self.DIRECTIONS['E'], 'W': self.DIRECTIONS['W']}
-        elif mode == 'horiz_vert':
-            return {k: v for k, v in self.DIRECTIONS.items() if k in ['N', 'S', 'E', 'W']}
-        else:  # 'all'
-            return self.DIRECTIONS.copy()
-    
-    def _create_empty_grid(self, size: int) -> List[List[str]]:
-        """Create empty grid filled with None."""
-        return [[None for _ in range(size)] for _ in range(size)]
-    
-    def _place_word(self, grid: List[List[str]], size: int, allowed_dirs: Dict,
-                   allow_overlap: bool, matches: List) -> bool:
-        """Attempt to place the target word in the grid."""
-        max_attempts = 1000
-        
-        for _ in range(max_attempts):
-            row = random.randint(0, size - 1)
-            col = random.randint(0, size - 1)
-            dir_name = random.choice(list(allowed_dirs.keys()))
-            dr, dc = allowed_dirs[dir_name]
-            
-            # Check bounds
-            end_row = row + dr * (len(self.TARGET_WORD) - 1)
-            end_col = col + dc * (len(self.TARGET_WORD) - 1)
-            
-            if not (0 <= end_row < size and 0 <= end_col < size):
-                continue
-            
-            # Check placement validity
-            cells = []
-            can_place = True
+    def _create_empty_grid(self, size: int) -> bytearray:
+        """
+        Create empty flat row-major grid of encoded letters.
+        
+        Cells hold the lane codes from _encode; a zero byte marks an empty cell.
+        """
+        return bytearray(size * size)
+    
+    def _grid_rows(self, grid: bytearray, size: int) -> List[List[str]]:
+        """Convert a flat encoded grid to the public list-of-rows form."""
+        text = grid.translate(self._CODE_LETTERS).decode('ascii')
+        return [list(text[row * size:(row + 1) * size]) for row in range(size)]
+    
+    def _place_word(self, grid: bytearray, candidates: List[Tuple],
+                   allow_overlap: bool) -> Optional[Tuple]:
+        """
+        Attempt to place the target word in the grid.
+        
+        Returns the chosen entry from the shared candidate table, or None if
+        no placement fits.
+        """
+        # Partial Fisher-Yates shuffle: each pick is uniform over the placements
+        # not tried yet, and every placement is tried at most once
+        word = self._encode(self.TARGET_WORD)
+        blank = bytes(len(word))
+        # Letter codes share no bits, so a cell fits the word exactly when it
+        # has no bits outside the wanted letter's code
+        conflicts = ~int.from_bytes(word, 'little')
+        total = len(candidates)
+        for pick in range(total):
+            swap = self._rng.randrange(pick, total)
+            candidates[pick], candidates[swap] = candidates[swap], candidates[pick]
+            placement = candidates[pick]
+            cell_slice = placement[4]
             
-            for i, letter in enumerate(self.TARGET_WORD):
-                r = row + dr * i
-                c = col + dc * i
-                cells.append((r, c))
-                
-                if grid[r][c] is not None:
-                    if not allow_overlap or grid[r][c] != letter:
-                        can_place = False
-                        break
+            # Check placement validity; an all-empty run is the common case
+            # and needs a single compare
+            current = grid[cell_slice]
+            if current != blank:
+                if not allow_overlap:
+                    continue
+                # Occupied cells can only be shared if they hold the same
+                # letter, and re-placing an existing word adds no match
+                if current == word or int.from_bytes(current, 'little') & conflicts:
+                    continue
             
-            if can_place:
-                # Place the word
-                for i, letter in enumerate(self.TARGET_WORD):
-                    r = row + dr * i
-                    c = col + dc * i
-                    grid[r][c] = letter
-                
-                matches.append({
-                    'start': (row, col),
-                    'direction': dir_name,
-                    'cells': cells
-                })
-                return True
+            # Place the word
+            grid[cell_slice] = word
+            return placement
         
-        return False
+        return None
     
-    def _fill_grid(self, grid: List[List[str]], size: int, distribution_mode: str):
+    def _fill_grid(self, grid: bytearray, size: int, distribution_mode: str):
         """Fill empty cells with random letters."""
+        letters = self._encode("".join(self.LETTERS))
         if distribution_mode == 'weighted':
             # F:4, K:4, U:1, C:1 ratio
-            weights = ['F'] * 4 + ['K'] * 4 + ['U'] + ['C']
+            weights = (4, 1, 1, 4)
         else:  # 'even'
-            weights = self.LETTERS
-        
-        for row in range(size):
-            for col in range(size):
-                if grid[row][col] is None:
-                    grid[row][col] = random.choice(weights)
-    
-    def _check_word_at_position(self, grid: List[List[str]], start_row: int, start_col: int,
-                               dr: int, dc: int, size: int) -> Optional[List[Tuple[int, int]]]:
-        """Check if target word exists starting at position in given direction."""
-        cells = []
-        word = ""
-        
-        for i in range(len(self.TARGET_WORD)):
-            r = start_row + dr * i
-            c = start_col + dc * i
-            
-            if not (0 <= r < size and 0 <= c < size):
-                return None
-            
-            cells.append((r, c))
-            word += grid[r][c]
-        
-        return cells if word == self.TARGET_WORD else None
-    
-    def _normalize_match(self, cells: List[Tuple[int, int]]) -> Tuple[Tuple[int, int], ...]:
-        """Normalize match cells for duplicate detection."""
-        return tuple(sorted(cells))
-    
-    def _is_duplicate_match(self, normalized_match: Tuple, matches: List[Dict]) -> bool:
-        """Check if this match already exists."""
-        for match in matches:
-            if self._normalize_match(match['cells']) == normalized_match:
-                return True
-        return False
+            weights = None
+        
+        # Draw a letter for every cell in one call, then merge the placed words
+        # back over it: occupied cells translate to 0xFF lanes that mask the
+        # filler out, so no cell is visited from Python
+        cell_count = size * size
+        fills = int.from_bytes(bytes(self._rng.choices(letters, weights=weights, k=cell_count)), 'little')
+        placed = int.from_bytes(grid, 'little')
+        occupied = int.from_bytes(grid.translate(_OCCUPIED_LANES), 'little')
+        grid[:] = (placed | (fills & ~occupied)).to_bytes(cell_count, 'little')
 
 
 # === DAILY SEED MODULE ===
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@lru_cache(maxsize=1)
+def _format_day(days: int) -> str:
+    """Format a day count since the Unix epoch as YYYY-MM-DD."""
+    return date.fromordinal(_EPOCH_ORDINAL + days).isoformat()
+
+
+@lru_cache(maxsize=4)
+def _daily_seed(salt: str, days: int) -> str:
+    """Build the daily seed for a salt and a day count since the Unix epoch."""
+    return f"{salt}-{_format_day(days)}"
+
+
+def _utc_days() -> int:
+    """Whole days elapsed since the Unix epoch, in UTC."""
+    return int(time.time()) // 86400
+
+
 class DailySeed:
     """Handles deterministic date-based seeds."""
     
     @staticmethod
     def get_daily_seed(salt: str = "hmf") -> str:
         """Generate deterministic seed based on current UTC date."""
-        utc_date = datetime.utcnow().strftime("%Y-%m-%d")
-        return f"{salt}-{utc_date}"
+        return _daily_seed(salt, _utc_days())
+    
+    @staticmethod
+    def utc_date() -> str:
+        """Current UTC date as YYYY-MM-DD, formatted once per day."""
+        return _format_day(_utc_days())
 
 
 # === RENDER MODULE ===
 
+class _CellStyles(dict):
+    """Letter -> rendered cell text, formatted once per letter and then reused."""
+    
+    def __init__(self, template: str):
+        super().__init__()
+        self.template = template
+    
+    def __missing__(self, letter: str) -> str:
+        cell = self[letter] = self.template.format(letter)
+        return cell
+
+
+# Indexed by the highlight flag: plain cells first, highlighted second
+_CELL_STYLES = (_CellStyles(" {} "), _CellStyles("[{}]"))
+
+
 class GridRenderer:
     """Handles text rendering and highlighting of grids."""
     
     def render_grid(self, grid: List[List[str]]) -> str:
         """Render grid as formatted text."""
-        lines = []
-        for row in grid:
-            lines.append(" ".join(row))
-        return "\n".join(lines)
+        return "\n".join([" ".join(row) for row in grid])
     
     def render_highlighted_grid(self, grid: List[List[str]], matches: List[Dict]) -> str:
         """Render grid with matched letters highlighted."""
         size = len(grid)
-        highlighted = [[cell for cell in row] for row in grid]  # Copy grid
         
-        # Track which cells are highlighted
-        highlight_cells = set()
+        # Mark highlighted cells in a flat row-major mask
+        mask = bytearray(size * size)
         for match in matches:
-            for cell in match['cells']:
-                highlight_cells.add(cell)
+            for row, col in match['cells']:
+                # Out-of-range cells would alias real ones in the flat mask
+                if 0 <= row < size and 0 <= col < size:
+                    mask[row * size + col] = 1
         
-        # Apply highlighting
+        # Apply highlighting; rows without highlights are joined in one go
+        blank = bytes(size)
         lines = []
-        for row in range(size):
-            line_parts = []
-            for col in range(size):
-                if (row, col) in highlight_cells:
-                    line_parts.append(f"[{grid[row][col]}]")
-                else:
-                    line_parts.append(f" {grid[row][col]} ")
-            lines.append("".join(line_parts))
+        for row, letters in enumerate(grid):
+            flags = mask[row * size:(row + 1) * size]
+            if flags == blank:
+                lines.append(" " + "  ".join(letters) + " ")
+            else:
+                lines.append("".join(_CELL_STYLES[flag][letter] for letter, flag in zip(letters, flags)))
         
         return "\n".join(lines)
     
@@ -296,6 +559,10 @@ class GridRenderer:
 
 # === CLI MODULE ===
 
+# Built on first use and shared by every CLI instance
+_PARSER = None
+
+
 class CLI:
     """Command-line interface for the game."""
     
@@ -315,8 +582,17 @@ class CLI:
         elif args.command == 'print':
             self.print_puzzle(args)
     
-    def create_parser(self) -> argparse.ArgumentParser:
+    def create_parser(self) -> 'argparse.ArgumentParser':
+        """Return the command-line argument parser, building it on first use."""
+        global _PARSER
+        if _PARSER is None:
+            _PARSER = self._build_parser()
+        return _PARSER
+    
+    def _build_parser(self) -> 'argparse.ArgumentParser':
         """Create command-line argument parser."""
+        import argparse  # deferred so library use of the engine skips it
+        
         parser = argparse.ArgumentParser(description='HowManyFucks - Word search counting game')
         subparsers = parser.add_subparsers(dest='command', help='Available commands')
         
@@ -405,7 +681,7 @@ class CLI:
         
         daily_args_converted = DailyArgs(args)
         print("=== DAILY PUZZLE ===")
-        print(f"Date: {datetime.utcnow().strftime('%Y-%m-%d')} (UTC)")
+        print(f"Date: {DailySeed.utc_date()} (UTC)")
         print(f"Seed: {daily_args_converted.seed}")
         print()
         